@@ -1,5 +1,6 @@
 """Base module for evolutionary algorithms."""
 
+import copy
 from collections.abc import Callable
 from functools import partial
 
@@ -7,6 +8,7 @@ import jax
 import jax.numpy as jnp
 from flax import struct
 from jax import flatten_util
+from jax.sharding import Mesh, NamedSharding, PartitionSpec
 
 from evosax.core.fitness_shaping import identity_fitness_shaping_fn
 from evosax.types import (
@@ -14,6 +16,7 @@ from evosax.types import (
     Metrics,
     Params as BaseParams,
     Population,
+    PyTree,
     Solution,
     State as BaseState,
 )
@@ -74,6 +77,9 @@ class EvolutionaryAlgorithm:
         # Fitness shaping function
         self.fitness_shaping_fn = fitness_shaping_fn
 
+        # Sharding of the population axis across devices, set by shard
+        self.population_sharding = None
+
         # Default elite ratio
         self.elite_ratio = 1.0
 
@@ -112,6 +118,7 @@ class EvolutionaryAlgorithm:
         """Ask evolutionary algorithm for new candidate solutions to evaluate."""
         # Generate population
         population, state = self._ask(key, state, params)
+        population = self._shard_population(population)
 
         # Unravel population
         population = jax.vmap(self._unravel_solution)(population)
@@ -130,6 +137,8 @@ class EvolutionaryAlgorithm:
         """Tell evolutionary algorithm fitness for state update."""
         # Ravel population
         population = jax.vmap(self._ravel_solution)(population)
+        population = self._shard_population(population)
+        fitness = self._shard_population(fitness)
 
         # Update best solution and fitness
         best_solution, best_fitness = update_best_solution_and_fitness(
@@ -149,6 +158,73 @@ class EvolutionaryAlgorithm:
 
         return state, metrics
 
+    @partial(jax.jit, static_argnames=("self", "eval_fn", "num_generations"))
+    def run_n_steps(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+        eval_fn: Callable,
+        problem_state: PyTree,
+        num_generations: int,
+    ) -> tuple[State, PyTree, Metrics]:
+        """Run several ask-evaluate-tell generations fused in a single jax.lax.scan.
+
+        Args:
+            key: Random key
+            state: Initialized algorithm state
+            params: Algorithm params
+            eval_fn: Function with the signature of Problem.eval, mapping
+                (key, population, problem_state) to (fitness, problem_state, info)
+            problem_state: Initial problem state, carried through the scan
+            num_generations: Number of generations to run
+
+        Returns:
+            tuple: containing the final state, the final problem state and the
+                metrics stacked over generations.
+
+        """
+
+        def step(carry, key):
+            state, problem_state = carry
+            key_ask, key_eval, key_tell = jax.random.split(key, 3)
+            population, state = self.ask(key_ask, state, params)
+            fitness, problem_state, _ = eval_fn(key_eval, population, problem_state)
+            state, metrics = self.tell(key_tell, population, fitness, state, params)
+            return (state, problem_state), metrics
+
+        keys = jax.random.split(key, num_generations)
+        (state, problem_state), metrics = jax.lax.scan(
+            step, (state, problem_state), keys
+        )
+        return state, problem_state, metrics
+
+    def shard(self, mesh: Mesh, axis_name: str = "pop") -> "EvolutionaryAlgorithm":
+        """Return a copy of the algorithm with the population sharded across devices.
+
+        The population and fitness are constrained to be split along their leading
+        axis over the mesh axis `axis_name`. XLA then partitions the batched
+        ask/tell computations and inserts the collectives needed for global
+        reductions such as argmin or top_k.
+        """
+        assert self._population_axis_size % mesh.shape[axis_name] == 0, (
+            "Population size must be divisible by number of devices along axis"
+        )
+        algo = copy.copy(self)
+        algo.population_sharding = NamedSharding(mesh, PartitionSpec(axis_name))
+        return algo
+
+    @property
+    def _population_axis_size(self) -> int:
+        """Get the size of the population axis that is sharded across devices."""
+        return self.population_size
+
+    def _shard_population(self, x: jax.Array) -> jax.Array:
+        """Constrain the leading population axis of x to the population sharding."""
+        if self.population_sharding is None:
+            return x
+        return jax.lax.with_sharding_constraint(x, self.population_sharding)
+
     def _init(self, key: jax.Array, params: Params) -> State:
         raise NotImplementedError
 
@@ -22,6 +22,7 @@ from ...learned_evolution.les_tools import (
     EvolutionPath,
     EvoPathMLP,
     FitnessFeatures,
+    convert_legacy_les_params,
     load_pkl_object,
     tanh_timestamp,
 )
@@ -61,12 +62,15 @@ class LearnedES(DistributionBasedAlgorithm):
         params_path: str | None = None,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        assume_finite: bool = False,
     ):
         """Initialize LES."""
         super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
 
         # LES components
-        self.fitness_features = FitnessFeatures(centered_rank=True, z_score=True)
+        self.fitness_features = FitnessFeatures(
+            centered_rank=True, z_score=True, assume_finite=assume_finite
+        )
         self.weight_layer = AttentionWeights(8)
         self.lr_layer = EvoPathMLP(8)
         self.evopath = EvolutionPath(
@@ -85,6 +89,8 @@ class LearnedES(DistributionBasedAlgorithm):
             data = pkgutil.get_data(__name__, f"../ckpt/les/{ckpt_fname}")
             self.les_params = load_pkl_object(data, pkg_load=True)
 
+        self.les_params = convert_legacy_les_params(self.les_params)
+
     @property
     def _default_params(self) -> Params:
         return Params(
@@ -44,11 +44,11 @@ class LM_MA_ES(MA_ES):
         self.elite_ratio = 0.5
         self.use_negative_weights = False
 
-    @property
-    def _default_params(self) -> Params:
-        # Calculate m for LM-MA-ES
+        # Number of evolution paths for LM-MA-ES
         self.m = int(4 + jnp.floor(3 * jnp.log(self.num_dims)))
 
+    @property
+    def _default_params(self) -> Params:
         # Get parent class parameters
         parent_params = super()._default_params
 
@@ -4,6 +4,7 @@
 """
 
 from collections.abc import Callable
+from functools import partial
 
 import jax
 import jax.numpy as jnp
@@ -11,13 +12,13 @@ import optax
 from flax import struct
 
 from evosax.core.fitness_shaping import identity_fitness_shaping_fn
-from evosax.types import Fitness, Population, Solution
+from evosax.types import Fitness, Metrics, Population, Solution
 
+from ..base import metrics_fn as base_metrics_fn
 from .base import (
     DistributionBasedAlgorithm,
     Params as BaseParams,
     State as BaseState,
-    metrics_fn,
 )
 
 
@@ -37,6 +38,25 @@ class Params(BaseParams):
     boltzmann_constant: float
 
 
+def metrics_fn(
+    key: jax.Array,
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+) -> Metrics:
+    """Compute metrics for simulated annealing, reporting the best chain's mean."""
+    metrics = base_metrics_fn(key, population, fitness, state, params)
+    mean = get_best_chain_mean(state)
+    return metrics | {"mean": mean, "mean_norm": jnp.linalg.norm(mean, axis=-1)}
+
+
+def get_best_chain_mean(state: State) -> jax.Array:
+    """Return the raveled mean of the chain with the best current fitness."""
+    means = state.mean.reshape(-1, state.mean.shape[-1])
+    return means[jnp.argmin(state.fitness)]
+
+
 class SimulatedAnnealing(DistributionBasedAlgorithm):
     """Simulated Annealing (SA)."""
 
@@ -45,15 +65,34 @@ class SimulatedAnnealing(DistributionBasedAlgorithm):
         population_size: int,
         solution: Solution,
         std_schedule: Callable = optax.constant_schedule(1.0),
+        num_chains: int = 1,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
     ):
         """Initialize SA."""
+        assert population_size % num_chains == 0, (
+            "Population size must be divisible by number of chains"
+        )
         super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
 
         # std schedule
         self.std_schedule = std_schedule
 
+        # Number of independent annealing chains. With more than one chain, state
+        # mean and fitness have shapes (num_chains, num_dims) and (num_chains,);
+        # a single chain keeps the unbatched shapes (num_dims,) and ().
+        self.num_chains = num_chains
+
+    @property
+    def members_per_chain(self):
+        """Get the number of candidate solutions sampled per chain."""
+        return self.population_size // self.num_chains
+
+    @property
+    def chain_shape(self) -> tuple[int, ...]:
+        """Get the leading shape of per-chain state, unbatched for a single chain."""
+        return () if self.num_chains == 1 else (self.num_chains,)
+
     @property
     def _default_params(self) -> Params:
         return Params(
@@ -63,10 +102,25 @@ class SimulatedAnnealing(DistributionBasedAlgorithm):
             boltzmann_constant=5.0,
         )
 
+    @partial(jax.jit, static_argnames=("self",))
+    def init(
+        self,
+        key: jax.Array,
+        mean: Solution,
+        params: Params,
+    ) -> State:
+        """Initialize SA with all chains starting from the same mean."""
+        state = self._init(key, params)
+        mean = self._ravel_solution(mean)
+        state = state.replace(
+            mean=jnp.broadcast_to(mean, self.chain_shape + (self.num_dims,))
+        )
+        return state
+
     def _init(self, key: jax.Array, params: Params) -> State:
         state = State(
-            mean=jnp.full((self.num_dims,), jnp.nan),
-            fitness=jnp.inf,
+            mean=jnp.full(self.chain_shape + (self.num_dims,), jnp.nan),
+            fitness=jnp.full(self.chain_shape, jnp.inf),
             std=self.std_schedule(0),
             temperature=params.temperature_init,
             best_solution=jnp.full((self.num_dims,), jnp.nan),
@@ -75,15 +129,23 @@ class SimulatedAnnealing(DistributionBasedAlgorithm):
         )
         return state
 
+    def get_mean(self, state: State) -> Solution:
+        """Return unravelled mean of the chain with the best current fitness."""
+        mean = self._unravel_solution(get_best_chain_mean(state))
+        return mean
+
     def _ask(
         self,
         key: jax.Array,
         state: State,
         params: Params,
     ) -> tuple[Population, State]:
-        z = jax.random.normal(key, (self.population_size, self.num_dims))
-        population = state.mean + state.std * z
-        return population, state
+        z = jax.random.normal(
+            key, (self.num_chains, self.members_per_chain, self.num_dims)
+        )
+        means = state.mean.reshape(self.num_chains, 1, self.num_dims)
+        population = means + state.std * z
+        return population.reshape(self.population_size, self.num_dims), state
 
     def _tell(
         self,
@@ -93,19 +155,29 @@ class SimulatedAnnealing(DistributionBasedAlgorithm):
         state: State,
         params: Params,
     ) -> State:
-        best_idx = jnp.argmin(fitness)
-        best_member, best_fitness = population[best_idx], fitness[best_idx]
+        # Group population and fitness by chain
+        population = population.reshape(
+            self.num_chains, self.members_per_chain, self.num_dims
+        )
+        fitness = fitness.reshape(self.num_chains, self.members_per_chain)
+        means = state.mean.reshape(self.num_chains, self.num_dims)
+        means_fitness = state.fitness.reshape(self.num_chains)
+
+        chain_idx = jnp.arange(self.num_chains)
+        best_idx = jnp.argmin(fitness, axis=1)
+        best_member = population[chain_idx, best_idx]
+        best_fitness = fitness[chain_idx, best_idx]
 
-        delta = best_fitness - state.fitness
+        delta = best_fitness - means_fitness
         metropolis = jnp.exp(-delta / (params.boltzmann_constant * state.temperature))
-        acceptance = jax.random.uniform(key)
+        acceptance = jax.random.uniform(key, (self.num_chains,))
 
         # Replace if improved or random metropolis acceptance
         replace = jnp.logical_or(delta < 0, acceptance < metropolis)
 
-        # Note: We replace by best member in generation
-        mean = jnp.where(replace, best_member, state.mean)
-        fitness = jnp.where(replace, best_fitness, state.fitness)
+        # Note: We replace by best member of each chain in generation
+        mean = jnp.where(replace[:, None], best_member, means)
+        fitness = jnp.where(replace, best_fitness, means_fitness)
 
         # Update temperature
         temperature = jnp.clip(
@@ -114,8 +186,8 @@ class SimulatedAnnealing(DistributionBasedAlgorithm):
         )
 
         return state.replace(
-            mean=mean,
+            mean=mean.reshape(state.mean.shape),
             std=self.std_schedule(state.generation_counter),
-            fitness=fitness,
+            fitness=fitness.reshape(state.fitness.shape),
             temperature=temperature,
         )
@@ -65,6 +65,7 @@ class SV_ES(DistributionBasedAlgorithm):
 
         # Reshape population
         population = population.reshape(self.total_population_size, self.num_dims)
+        population = self._shard_population(population)
 
         # Unravel population
         population = jax.vmap(self._unravel_solution)(population)
@@ -84,6 +85,11 @@ class SV_ES(DistributionBasedAlgorithm):
         # Ravel population
         population = jax.vmap(jax.vmap(self._ravel_solution))(population)
 
+        # Shard flat population and fitness
+        population = population.reshape(self.total_population_size, self.num_dims)
+        population = self._shard_population(population)
+        fitness = self._shard_population(fitness.reshape(self.total_population_size))
+
         # Reshape population and fitness
         population = population.reshape(
             self.num_populations, self.population_size, self.num_dims
@@ -114,6 +120,11 @@ class SV_ES(DistributionBasedAlgorithm):
 
         return state, metrics
 
+    @property
+    def _population_axis_size(self) -> int:
+        """Get the size of the flat population axis across all populations."""
+        return self.total_population_size
+
     def _init(self, key: jax.Array, params: Params) -> State:
         keys = jax.random.split(key, num=self.num_populations)
         state = jax.vmap(super()._init, in_axes=(0, None))(keys, params)
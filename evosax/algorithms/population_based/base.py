@@ -55,6 +55,7 @@ class PopulationBasedAlgorithm(EvolutionaryAlgorithm):
 
         # Ravel population
         population = jax.vmap(self._ravel_solution)(population)
+        population = self._shard_population(population)
 
         # Shape fitness
         fitness = self.fitness_shaping_fn(population, fitness, state, params)
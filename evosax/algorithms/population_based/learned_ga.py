@@ -65,6 +65,7 @@ class LearnedGA(PopulationBasedAlgorithm):
         params_path: str | None = None,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        assume_finite: bool = False,
     ):
         """Initialize LGA."""
         super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
@@ -72,10 +73,12 @@ class LearnedGA(PopulationBasedAlgorithm):
         self.elite_ratio = 1.0
 
         # LGA components
-        self.fitness_features = FitnessFeatures(centered_rank=True, z_score=True)
+        self.fitness_features = FitnessFeatures(
+            centered_rank=True, z_score=True, assume_finite=assume_finite
+        )
         self.selection_layer = SelectionAttention(2, 16)
         self.sampling_layer = SamplingAttention(2, 16)
-        self.mutation_layer = MutationAttention(2, 16)
+        self.mutation_layer = MutationAttention(2, 16, assume_finite)
 
         if params is not None:
             # Set params provided
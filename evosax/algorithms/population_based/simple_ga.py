@@ -42,6 +42,7 @@ class SimpleGA(PopulationBasedAlgorithm):
         population_size: int,
         solution: Solution,
         std_schedule: Callable = optax.constant_schedule(1.0),
+        low_precision_noise: bool = False,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
     ):
@@ -53,6 +54,9 @@ class SimpleGA(PopulationBasedAlgorithm):
         # std schedule
         self.std_schedule = std_schedule
 
+        # Opt-in bfloat16 mutation noise, upcast before it is added to solutions
+        self.low_precision_noise = low_precision_noise
+
     @property
     def _default_params(self) -> Params:
         return Params(crossover_rate=0.0)
@@ -75,26 +79,23 @@ class SimpleGA(PopulationBasedAlgorithm):
         params: Params,
     ) -> tuple[Population, State]:
         # Get elites
-        idx = jnp.argsort(state.fitness)
-        population = state.population[idx]
-        p = jnp.arange(self.population_size) < self.num_elites
+        _, elite_idx = jax.lax.top_k(-state.fitness, self.num_elites)
+        elites = state.population[elite_idx]
 
         key_crossover, key_mutation, key_1, key_2 = jax.random.split(key, 4)
-        key_crossover = jax.random.split(key_crossover, self.population_size)
-        key_mutation = jax.random.split(key_mutation, self.population_size)
 
         # Crossover
-        parents_1 = jax.random.choice(key_1, population, (self.population_size,), p=p)
-        parents_2 = jax.random.choice(key_2, population, (self.population_size,), p=p)
+        idx_1 = jax.random.randint(key_1, (self.population_size,), 0, self.num_elites)
+        idx_2 = jax.random.randint(key_2, (self.population_size,), 0, self.num_elites)
+        parents_1, parents_2 = elites[idx_1], elites[idx_2]
 
-        population = jax.vmap(crossover, in_axes=(0, 0, 0, None))(
+        population = crossover(
             key_crossover, parents_1, parents_2, params.crossover_rate
         )
 
         # Mutation
-        population = jax.vmap(mutation, in_axes=(0, 0, None))(
-            key_mutation, population, state.std
-        )
+        noise_dtype = jnp.bfloat16 if self.low_precision_noise else population.dtype
+        population = mutation(key_mutation, population, state.std, noise_dtype)
 
         return population, state
 
@@ -116,11 +117,18 @@ class SimpleGA(PopulationBasedAlgorithm):
 def crossover(
     key: jax.Array, parent_1: Solution, parent_2: Solution, crossover_rate: float
 ) -> Solution:
-    """Crossover between two parents."""
+    """Crossover between two (batches of) parents."""
     mask = jax.random.uniform(key, parent_1.shape) < crossover_rate
-    return parent_1 * (1 - mask) + parent_2 * mask
+    return jnp.where(mask, parent_2, parent_1)
 
 
-def mutation(key: jax.Array, solution: Solution, std: jax.Array) -> Solution:
-    """Mutation of a solution."""
-    return solution + std * jax.random.normal(key, solution.shape)
+def mutation(
+    key: jax.Array, solution: Solution, std: jax.Array, dtype: jnp.dtype | None = None
+) -> Solution:
+    """Mutation of a (batch of) solution(s), accumulating noise in solution dtype."""
+    dtype = solution.dtype if dtype is None else dtype
+    z = jax.random.normal(key, solution.shape, dtype=dtype)
+    # XLA may drop a narrowing convert under jit, so round to dtype explicitly
+    finfo = jnp.finfo(dtype)
+    z = jax.lax.reduce_precision(z.astype(solution.dtype), finfo.nexp, finfo.nmant)
+    return solution + std * z
@@ -54,39 +54,30 @@ class FitnessFeaturizer:
         self, x: jax.Array, fitness: jax.Array, state: FitnessFeaturesState
     ) -> tuple[jax.Array, FitnessFeaturesState]:
         fitness = jax.lax.select(self.maximize, -1 * fitness, fitness)
-        fit_out = centered_rank(fitness).reshape(-1, 1)
+        features = [centered_rank(fitness)]
 
         if self.improved_best:
-            fit_improve = ((fitness < state.best_fitness) * 1.0).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_improve], axis=1)
+            features.append((fitness < state.best_fitness) * 1.0)
 
         if self.z_score:
-            fit_zs = standardize(fitness).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_zs], axis=1)
+            features.append(standardize(fitness))
 
         if self.norm_diff_best:
-            fit_best = get_norm_diff_best(fitness, state.best_fitness).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_best], axis=1)
+            features.append(get_norm_diff_best(fitness, state.best_fitness))
 
         if self.norm_range:
-            fit_norm = normalize(fitness, -0.5, 0.5).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_norm], axis=1)
+            features.append(normalize(fitness, -0.5, 0.5))
 
         if self.snes_weights:
-            fit_snes = get_nes_weights(fitness.shape[0])[fitness.argsort()].reshape(
-                -1, 1
-            )
-            fit_out = jnp.concatenate([fit_out, fit_snes], axis=1)
+            features.append(get_nes_weights(fitness.shape[0])[fitness.argsort()])
 
         if self.des_weights:
-            fit_des = get_des_weights(fitness.shape[0])[fitness.argsort()].reshape(
-                -1, 1
-            )
-            fit_out = jnp.concatenate([fit_out, fit_des], axis=1)
+            features.append(get_des_weights(fitness.shape[0])[fitness.argsort()])
 
         if self.w_decay:
-            fit_wnorm = l2_norm_sq(x).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_wnorm], axis=1)
+            features.append(l2_norm_sq(x))
+
+        fit_out = jnp.stack(features, axis=1)
 
         best_fitness = update_best_fitness(fitness, state.best_fitness, self.maximize)
         return fit_out, FitnessFeaturesState(best_fitness=best_fitness)
@@ -132,7 +123,6 @@ def update_best_fitness(
 
 
 def get_norm_diff_best(fitness: jax.Array, best_fitness: float) -> jax.Array:
-    fitness = jnp.clip(fitness, -1e10, 1e10)
     diff_best = fitness - best_fitness
     return jnp.clip(
         diff_best / (jnp.nanmax(diff_best) - jnp.nanmin(diff_best) + 1e-10),
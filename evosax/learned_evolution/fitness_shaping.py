@@ -6,15 +6,24 @@ import jax.numpy as jnp
 from evosax.types import Fitness, Solution
 
 
-def standardize(fitness: jax.Array) -> jax.Array:
-    """Return standardized fitness."""
-    return jax.nn.standardize(fitness, axis=-1, epsilon=1e-8, where=~jnp.isnan(fitness))
-
-
-def normalize(arr: jax.Array, min_val: float = -1.0, max_val: float = 1.0) -> jax.Array:
-    """Normalize fitness."""
-    arr_min = jnp.nanmin(arr)
-    arr_max = jnp.nanmax(arr)
+def standardize(fitness: jax.Array, assume_finite: bool = False) -> jax.Array:
+    """Return standardized fitness, skipping the NaN mask if assume_finite."""
+    where = None if assume_finite else ~jnp.isnan(fitness)
+    return jax.nn.standardize(fitness, axis=-1, epsilon=1e-8, where=where)
+
+
+def normalize(
+    arr: jax.Array,
+    min_val: float = -1.0,
+    max_val: float = 1.0,
+    assume_finite: bool = False,
+) -> jax.Array:
+    """Normalize fitness, using plain min/max reductions if assume_finite."""
+    reduce_min, reduce_max = (
+        (jnp.min, jnp.max) if assume_finite else (jnp.nanmin, jnp.nanmax)
+    )
+    arr_min = reduce_min(arr)
+    arr_max = reduce_max(arr)
 
     return jnp.where(
         jnp.allclose(arr_max, arr_min),
@@ -34,8 +43,11 @@ def rank(fitness: Fitness) -> jax.Array:
 def centered_rank(fitness: Fitness) -> jax.Array:
     """Return centered ranks in [-0.5, 0.5] according to fitness."""
     assert fitness.ndim == 1
-    ranks = rank(fitness)
-    return ranks / (fitness.size - 1) - 0.5
+    # Scatter centered ranks directly instead of materializing integer ranks
+    idx = jnp.argsort(fitness)
+    dtype = jnp.promote_types(fitness.dtype, jnp.float32)
+    centered_ranks = jnp.linspace(-0.5, 0.5, fitness.size, dtype=dtype)
+    return jnp.zeros(fitness.shape, dtype=dtype).at[idx].set(centered_ranks)
 
 
 def l2_norm_sq(solution: Solution) -> jax.Array:
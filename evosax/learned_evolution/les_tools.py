@@ -1,11 +1,15 @@
 import functools
 import pickle
+from collections.abc import Callable
 from typing import Any
 
 import jax
 import jax.numpy as jnp
+import numpy as np
 from flax import linen as nn
 
+from evosax.types import PyTree
+
 from .fitness_shaping import (
     centered_rank,
     l2_norm_sq,
@@ -24,17 +28,44 @@ def load_pkl_object(filename: Any, pkg_load: bool = False) -> Any:
     return obj
 
 
-def tanh_timestamp(x: jax.Array) -> jax.Array:
-    """Timestamp embedding with evo-adapted timescales (Metz et al., 2022)."""
+def convert_legacy_les_params(les_params: PyTree) -> PyTree:
+    """Convert LES params saved with unfused Dense layers to the fused layout."""
+    les_params = dict(les_params)
+
+    recomb_params = les_params["recomb_weights"]["params"]
+    if "Dense_2" in recomb_params:
+        # Legacy layout: Dense_0 keys, Dense_1 queries, Dense_2 values
+        keys, queries, values = (recomb_params[f"Dense_{i}"] for i in range(3))
+        qkv = jax.tree.map(
+            lambda q, k, v: jnp.concatenate([q, k, v], axis=-1), queries, keys, values
+        )
+        les_params["recomb_weights"] = {"params": {"Dense_0": qkv}}
+
+    lrate_params = les_params["lrate_modulation"]["params"]
+    if "Dense_2" in lrate_params:
+        # Legacy layout: Dense_0 hidden, Dense_1 mean head, Dense_2 std head
+        heads = jax.tree.map(
+            lambda mean, std: jnp.concatenate([mean, std], axis=-1),
+            lrate_params["Dense_1"],
+            lrate_params["Dense_2"],
+        )
+        les_params["lrate_modulation"] = {
+            "params": {"Dense_0": lrate_params["Dense_0"], "Dense_1": heads}
+        }
 
-    def single_frequency(timescale):
-        return jnp.tanh(x / jnp.float32(timescale) - 1.0)
+    return les_params
+
+
+# Evo-adapted timescales for the timestamp embedding, kept on host as a constant
+TANH_TIMESCALES = np.asarray(
+    [1, 3, 10, 30, 50, 100, 250, 500, 750, 1000, 1250, 1500, 2000],
+    dtype=np.float32,
+)
 
-    all_frequencies = jnp.asarray(
-        [1, 3, 10, 30, 50, 100, 250, 500, 750, 1000, 1250, 1500, 2000],
-        dtype=jnp.float32,
-    )
-    return jax.vmap(single_frequency)(all_frequencies)
+
+def tanh_timestamp(x: jax.Array) -> jax.Array:
+    """Timestamp embedding with evo-adapted timescales (Metz et al., 2022)."""
+    return jnp.tanh(x / TANH_TIMESCALES - 1.0)
 
 
 class EvolutionPath:
@@ -48,13 +79,22 @@ class EvolutionPath:
 
     def update(self, paths: jax.Array, diff: jax.Array) -> jax.Array:
         """Batch update evolution paths for multiple dims & timescales."""
+        return (1 - self.timescales) * paths + self.timescales * diff[:, None]
 
-        def update_path(lr, path, diff):
-            return (1 - lr) * path + lr * diff
 
-        return jax.vmap(update_path, in_axes=(0, 1, None), out_axes=1)(
-            self.timescales, paths, diff
-        )
+def get_fitness_feature_fns(assume_finite: bool = False) -> dict[str, Callable]:
+    """Return optional fitness features in the column order of pretrained ckpts."""
+    return {
+        "centered_rank": lambda x, fitness, best_fitness: centered_rank(fitness),
+        "z_score": lambda x, fitness, best_fitness: standardize(fitness, assume_finite),
+        "diff_best": lambda x, fitness, best_fitness: norm_diff_best(
+            fitness, best_fitness, assume_finite
+        ),
+        "norm_range": lambda x, fitness, best_fitness: normalize(
+            fitness, -1.0, 1.0, assume_finite
+        ),
+        "w_decay": lambda x, fitness, best_fitness: l2_norm_sq(x),
+    }
 
 
 class FitnessFeatures:
@@ -68,6 +108,7 @@ class FitnessFeatures:
         diff_best: bool = False,
         norm_range: bool = False,
         maximize: bool = False,
+        assume_finite: bool = False,
     ):
         self.centered_rank = centered_rank
         self.z_score = z_score
@@ -75,39 +116,36 @@ class FitnessFeatures:
         self.diff_best = diff_best
         self.norm_range = norm_range
         self.maximize = maximize
+        self.assume_finite = assume_finite
+
+        # Select enabled feature functions once so apply traces a fixed pipeline
+        self.feature_fns = [
+            fn
+            for name, fn in get_fitness_feature_fns(assume_finite).items()
+            if getattr(self, name)
+        ]
 
     @functools.partial(jax.jit, static_argnames=("self",))
     def apply(self, x: jax.Array, fitness: jax.Array, best_fitness: float) -> jax.Array:
-        """Compute and concatenate different fitness transformations."""
-        fitness = jax.lax.select(self.maximize, -1 * fitness, fitness)
-        fit_out = ((fitness < best_fitness) * 1.0).reshape(-1, 1)
-
-        if self.centered_rank:
-            fit_cr = centered_rank(fitness).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_cr], axis=1)
-        if self.z_score:
-            fit_zs = standardize(fitness).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_zs], axis=1)
-        if self.diff_best:
-            fit_best = norm_diff_best(fitness, best_fitness).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_best], axis=1)
-        if self.norm_range:
-            fit_norm = normalize(fitness, -1.0, 1.0).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_norm], axis=1)
-        if self.w_decay:
-            fit_wnorm = l2_norm_sq(x).reshape(-1, 1)
-            fit_out = jnp.concatenate([fit_out, fit_wnorm], axis=1)
-        return fit_out
-
-
-def norm_diff_best(fitness: jax.Array, best_fitness: float) -> jax.Array:
+        """Compute and stack different fitness transformations."""
+        fitness = -fitness if self.maximize else fitness
+        features = [(fitness < best_fitness) * 1.0]
+        features += [fn(x, fitness, best_fitness) for fn in self.feature_fns]
+        return jnp.stack(features, axis=1)
+
+
+def norm_diff_best(
+    fitness: jax.Array, best_fitness: float, assume_finite: bool = False
+) -> jax.Array:
     """Normalize difference from best previous fitness score."""
-    fitness = jnp.clip(fitness, -1e10, 1e10)
+    reduce_min, reduce_max = (
+        (jnp.min, jnp.max) if assume_finite else (jnp.nanmin, jnp.nanmax)
+    )
     diff_best = fitness - best_fitness
     return jnp.clip(
-        diff_best / (jnp.nanmax(diff_best) - jnp.nanmin(diff_best.min) + 1e-10),
-        -1,
-        1,
+        diff_best / (reduce_max(diff_best) - reduce_min(diff_best) + 1e-10),
+        -1.0,
+        1.0,
     )
 
 
@@ -118,9 +156,10 @@ class AttentionWeights(nn.Module):
 
     @nn.compact
     def __call__(self, X: jax.Array) -> jax.Array:
-        keys = nn.Dense(self.att_hidden_dims)(X)
-        queries = nn.Dense(self.att_hidden_dims)(X)
-        values = nn.Dense(1)(X)
+        qkv = nn.Dense(2 * self.att_hidden_dims + 1)(X)
+        queries, keys, values = jnp.split(
+            qkv, [self.att_hidden_dims, 2 * self.att_hidden_dims], axis=-1
+        )
         A = nn.softmax(jnp.matmul(queries, keys.T) / jnp.sqrt(X.shape[0]))
         weights = nn.softmax(jnp.matmul(A, values).squeeze())
         return weights[:, None]
@@ -138,11 +177,12 @@ class EvoPathMLP(nn.Module):
         path_sigma: jax.Array,
         time_embed: jax.Array,
     ):
-        timestamps = jnp.repeat(time_embed[None, ...], repeats=path_c.shape[0], axis=0)
+        timestamps = jnp.broadcast_to(
+            time_embed[None, :], (path_c.shape[0], time_embed.shape[0])
+        )
         X = jnp.concatenate([path_c, path_sigma, timestamps], axis=1)
         # Perform MLP hidden state update for each solution dim. in parallel
-        hidden = jax.vmap(nn.Dense(self.mlp_hidden_dims), in_axes=(0))(X)
-        hidden = nn.relu(hidden)
-        lrs_mean = nn.sigmoid(nn.Dense(1)(hidden)).squeeze()
-        lrs_sigma = nn.sigmoid(nn.Dense(1)(hidden)).squeeze()
-        return lrs_mean, lrs_sigma
+        hidden = nn.relu(nn.Dense(self.mlp_hidden_dims)(X))
+        # Mean and std learning rate heads share a single Dense layer
+        lrs = nn.sigmoid(nn.Dense(2)(hidden))
+        return lrs[..., 0], lrs[..., 1]
@@ -161,11 +161,12 @@ class SelectionAttention(nn.Module):
 class MutationAttention(nn.Module):
     num_att_heads: int
     att_hidden_dims: int
+    assume_finite: bool = False
 
     @nn.compact
     def __call__(self, sigma: jax.Array, F: jax.Array) -> jax.Array:
-        z_feat = standardize(sigma)
-        norm_feat = normalize(sigma)
+        z_feat = standardize(sigma, self.assume_finite)
+        norm_feat = normalize(sigma, assume_finite=self.assume_finite)
         conc_inputs = jnp.concatenate([F, z_feat, norm_feat], axis=1)
         M = MultiHeadSelfAttention(self.num_att_heads, self.att_hidden_dims)(
             conc_inputs
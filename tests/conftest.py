@@ -1,5 +1,12 @@
 """Pytest configuration file for evosax tests."""
 
+import os
+
+# Expose several CPU devices to test sharding, set before JAX initializes backends
+os.environ["XLA_FLAGS"] = (
+    os.environ.get("XLA_FLAGS", "") + " --xla_force_host_platform_device_count=4"
+)
+
 import jax
 import pytest
 from evosax.algorithms.distribution_based import distribution_based_algorithms
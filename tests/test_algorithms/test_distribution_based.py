@@ -3,7 +3,15 @@
 import jax
 import jax.numpy as jnp
 import optax
-from evosax.algorithms.distribution_based import Open_ES, distribution_based_algorithms
+import pytest
+from evosax.algorithms.distribution_based import (
+    LM_MA_ES,
+    Open_ES,
+    SimulatedAnnealing,
+    SV_Open_ES,
+    distribution_based_algorithms,
+)
+from jax.sharding import PartitionSpec
 
 
 def test_run(
@@ -230,3 +238,155 @@ def test_open_es_runs_with_adamw_optimizer(key, population_size, bbob_problem):
 
     assert jnp.all(jnp.isfinite(state.mean))
     assert jnp.isfinite(metrics["best_fitness"])
+
+
+def test_sv_es_shard(key, num_dims, population_size, bbob_problem):
+    """Sharding SV_ES should not change the optimization trajectory."""
+    if len(jax.devices()) < 2:
+        pytest.skip("Sharding requires at least 2 devices")
+
+    num_generations, num_populations = 4, 2
+    solution = bbob_problem.sample(key)
+    algo = SV_Open_ES(
+        population_size=population_size,
+        num_populations=num_populations,
+        solution=solution,
+    )
+    mesh = jax.make_mesh((len(jax.devices()),), ("pop",))
+    sharded_algo = algo.shard(mesh)
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    problem_state = bbob_problem.init(subkey)
+
+    key, subkey = jax.random.split(key)
+    keys = jax.random.split(subkey, num_populations)
+    means_init = jax.vmap(bbob_problem.sample)(keys)
+
+    key, key_init, key_run = jax.random.split(key, 3)
+    state = algo.init(key_init, means_init, params)
+    state, _, metrics = algo.run_n_steps(
+        key_run, state, params, bbob_problem.eval, problem_state, num_generations
+    )
+
+    sharded_state = sharded_algo.init(key_init, means_init, params)
+    sharded_state, _, sharded_metrics = sharded_algo.run_n_steps(
+        key_run,
+        sharded_state,
+        params,
+        bbob_problem.eval,
+        problem_state,
+        num_generations,
+    )
+
+    assert jnp.allclose(state.mean, sharded_state.mean, atol=1e-5)
+    assert jnp.allclose(metrics["best_fitness"], sharded_metrics["best_fitness"])
+
+    # The sharding constraint is applied to the flat population returned by ask
+    population, _ = sharded_algo.ask(key_run, sharded_state, params)
+    assert population.sharding.spec == PartitionSpec("pop")
+
+
+def test_lm_ma_es_shard_before_default_params(key, num_dims, population_size):
+    """Sharding before accessing default params should keep all attributes."""
+    algo = LM_MA_ES(population_size=population_size, solution=jnp.zeros(num_dims))
+    mesh = jax.make_mesh((1,), ("pop",))
+    sharded_algo = algo.shard(mesh)
+    assert sharded_algo.m == algo.m
+    assert sharded_algo.default_params.c_d.shape == (algo.m,)
+
+
+def test_simulated_annealing_multiple_chains(key, num_dims, bbob_problem):
+    """SimulatedAnnealing should run independent chains over a shared population."""
+    num_chains, population_size = 4, 16
+    solution = bbob_problem.sample(key)
+    algo = SimulatedAnnealing(
+        population_size=population_size, solution=solution, num_chains=num_chains
+    )
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    mean_init = bbob_problem.sample(subkey)
+
+    key, subkey = jax.random.split(key)
+    state = algo.init(subkey, mean_init, params)
+    assert state.mean.shape == (num_chains, num_dims)
+
+    key, subkey = jax.random.split(key)
+    problem_state = bbob_problem.init(subkey)
+
+    key, key_ask, key_eval, key_tell = jax.random.split(key, 4)
+    population, state = algo.ask(key_ask, state, params)
+    assert population.shape == (population_size, num_dims)
+
+    fitness, problem_state, _ = bbob_problem.eval(key_eval, population, problem_state)
+    state, metrics = algo.tell(key_tell, population, fitness, state, params)
+
+    assert state.fitness.shape == (num_chains,)
+    assert jnp.allclose(state.fitness, fitness.reshape(num_chains, -1).min(axis=1))
+    assert jnp.isclose(metrics["best_fitness"], fitness.min())
+    assert jnp.allclose(metrics["mean"], mean_init)
+    assert algo.get_mean(state).shape == (num_dims,)
+
+    # Metrics report the mean of the best chain, consistent with get_mean
+    key, key_ask, key_eval, key_tell = jax.random.split(key, 4)
+    population, state = algo.ask(key_ask, state, params)
+    fitness, problem_state, _ = bbob_problem.eval(key_eval, population, problem_state)
+    mean = algo.get_mean(state)
+    _, metrics = algo.tell(key_tell, population, fitness, state, params)
+    assert jnp.allclose(metrics["mean"], mean)
+    assert metrics["mean_norm"].shape == ()
+
+
+def test_simulated_annealing_single_chain(key, num_dims, bbob_problem):
+    """SimulatedAnnealing with a single chain should keep the unbatched state."""
+    population_size = 16
+    solution = bbob_problem.sample(key)
+    algo = SimulatedAnnealing(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    mean_init = bbob_problem.sample(subkey)
+
+    key, subkey = jax.random.split(key)
+    state = algo.init(subkey, mean_init, params)
+    assert state.mean.shape == (num_dims,)
+    assert state.fitness.shape == ()
+
+    key, subkey = jax.random.split(key)
+    problem_state = bbob_problem.init(subkey)
+
+    key, key_ask, key_eval, key_tell = jax.random.split(key, 4)
+    population, state = algo.ask(key_ask, state, params)
+    fitness, problem_state, _ = bbob_problem.eval(key_eval, population, problem_state)
+    state, metrics = algo.tell(key_tell, population, fitness, state, params)
+
+    assert state.mean.shape == (num_dims,)
+    assert state.fitness.shape == ()
+    assert jnp.isclose(state.fitness, fitness.min())
+    assert metrics["mean"].shape == (num_dims,)
+    assert metrics["mean_norm"].shape == ()
+
+
+def test_simulated_annealing_run_n_steps(key, num_dims, population_size, bbob_problem):
+    """run_n_steps should fuse several generations into one scan."""
+    num_generations = 4
+    solution = bbob_problem.sample(key)
+    algo = SimulatedAnnealing(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    state = algo.init(subkey, jnp.ones((num_dims,)), params)
+
+    key, subkey = jax.random.split(key)
+    problem_state = bbob_problem.init(subkey)
+
+    key, subkey = jax.random.split(key)
+    state, problem_state, metrics = algo.run_n_steps(
+        subkey, state, params, bbob_problem.eval, problem_state, num_generations
+    )
+
+    assert state.generation_counter == num_generations
+    assert problem_state.counter == num_generations
+    assert metrics["best_fitness"].shape == (num_generations,)
+    assert jnp.all(jnp.diff(metrics["best_fitness"]) <= 0)
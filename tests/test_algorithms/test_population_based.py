@@ -2,7 +2,14 @@
 
 import jax
 import jax.numpy as jnp
-from evosax.algorithms.population_based import population_based_algorithms
+import optax
+import pytest
+from evosax.algorithms.population_based import (
+    LearnedGA,
+    SimpleGA,
+    population_based_algorithms,
+)
+from jax.sharding import NamedSharding, PartitionSpec
 
 
 def test_run(
@@ -149,3 +156,183 @@ def test_base_api(population_based_algorithm_name, key, num_dims, population_siz
     assert "best_solution" in metrics
     assert "best_fitness_in_generation" in metrics
     assert "best_solution_in_generation" in metrics
+
+
+def test_learned_ga_assume_finite(key, num_dims, population_size, bbob_problem):
+    """LearnedGA with assume_finite should match the NaN-aware default."""
+    solution = bbob_problem.sample(key)
+    algo = LearnedGA(population_size=population_size, solution=solution)
+    finite_algo = LearnedGA(
+        population_size=population_size, solution=solution, assume_finite=True
+    )
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    population_init = jax.random.normal(subkey, (population_size, num_dims))
+    fitness_init = jnp.sum(population_init**2, axis=-1)
+
+    key, key_init, key_ask, key_tell = jax.random.split(key, 4)
+    state = algo.init(key_init, population_init, fitness_init, params)
+    population, state = algo.ask(key_ask, state, params)
+    fitness = jnp.sum(population**2, axis=-1)
+    state, _ = algo.tell(key_tell, population, fitness, state, params)
+
+    finite_state = finite_algo.init(key_init, population_init, fitness_init, params)
+    finite_population, finite_state = finite_algo.ask(key_ask, finite_state, params)
+    finite_state, _ = finite_algo.tell(
+        key_tell, finite_population, fitness, finite_state, params
+    )
+
+    assert jnp.allclose(finite_population, population, atol=1e-5)
+    assert jnp.allclose(finite_state.std, state.std, atol=1e-5)
+
+
+def test_simple_ga_low_precision_noise(key, num_dims, population_size):
+    """SimpleGA should sample bfloat16 noise but return float32 solutions."""
+    std = 0.5
+    solution = jnp.zeros((num_dims,))
+    params = SimpleGA(population_size, solution).default_params
+
+    # Identical elites without crossover, so each child is elite + std * noise
+    population_init = jnp.zeros((population_size, num_dims))
+    fitness_init = jnp.zeros((population_size,))
+
+    key_init, key_ask = jax.random.split(key)
+    for low_precision_noise in [True, False]:
+        algo = SimpleGA(
+            population_size=population_size,
+            solution=solution,
+            std_schedule=optax.constant_schedule(std),
+            low_precision_noise=low_precision_noise,
+        )
+        state = algo.init(key_init, population_init, fitness_init, params)
+        population, state = algo.ask(key_ask, state, params)
+        assert population.dtype == jnp.float32
+        assert population.shape == (population_size, num_dims)
+
+        noise = (population - population_init) / std
+        is_bfloat16 = noise.astype(jnp.bfloat16).astype(jnp.float32) == noise
+        if low_precision_noise:
+            assert jnp.all(is_bfloat16)
+        else:
+            assert not jnp.all(is_bfloat16)
+
+
+def test_simple_ga_low_precision_noise_crossover_rate(key):
+    """Low precision noise should not round small crossover rates."""
+    population_size, num_dims, crossover_rate = 1000, 100, 0.001
+    solution = jnp.zeros((num_dims,))
+    algo = SimpleGA(
+        population_size=population_size,
+        solution=solution,
+        std_schedule=optax.constant_schedule(0.0),
+        low_precision_noise=True,
+    )
+    params = algo.default_params.replace(crossover_rate=crossover_rate)
+
+    # Elites are half zeros and half ones, so crossover between different parents
+    # shows up as minority genes within a child
+    num_elites = population_size // 2
+    population_init = jnp.zeros((population_size, num_dims))
+    population_init = population_init.at[: num_elites // 2].set(1.0)
+    fitness_init = jnp.where(jnp.arange(population_size) < num_elites, 0.0, 1.0)
+
+    key, subkey = jax.random.split(key)
+    state = algo.init(subkey, population_init, fitness_init, params)
+
+    key, subkey = jax.random.split(key)
+    population, state = algo.ask(subkey, state, params)
+
+    # Half of the children have parents with different values
+    row_mean = jnp.mean(population, axis=-1)
+    observed_rate = 2 * jnp.mean(jnp.minimum(row_mean, 1.0 - row_mean))
+    assert jnp.abs(observed_rate - crossover_rate) < 0.5 * crossover_rate
+
+
+def test_simple_ga_run_n_steps(key, num_dims, population_size, bbob_problem):
+    """run_n_steps should match the equivalent loop of ask, eval and tell."""
+    num_generations = 4
+    solution = bbob_problem.sample(key)
+    algo = SimpleGA(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    problem_state = bbob_problem.init(subkey)
+
+    key, subkey = jax.random.split(key)
+    population_init = jax.random.normal(subkey, (population_size, num_dims))
+    key, subkey = jax.random.split(key)
+    fitness_init, problem_state, _ = bbob_problem.eval(
+        subkey, population_init, problem_state
+    )
+
+    key, subkey = jax.random.split(key)
+    state_init = algo.init(subkey, population_init, fitness_init, params)
+
+    key, subkey = jax.random.split(key)
+    state, final_problem_state, metrics = algo.run_n_steps(
+        subkey, state_init, params, bbob_problem.eval, problem_state, num_generations
+    )
+
+    assert state.generation_counter == num_generations
+    assert final_problem_state.counter == num_generations + 1
+    assert metrics["best_fitness"].shape == (num_generations,)
+
+    # Same keys as run_n_steps
+    loop_state, best_fitness = state_init, []
+    for key_step in jax.random.split(subkey, num_generations):
+        key_ask, key_eval, key_tell = jax.random.split(key_step, 3)
+        population, loop_state = algo.ask(key_ask, loop_state, params)
+        fitness, problem_state, _ = bbob_problem.eval(
+            key_eval, population, problem_state
+        )
+        loop_state, loop_metrics = algo.tell(
+            key_tell, population, fitness, loop_state, params
+        )
+        best_fitness.append(loop_metrics["best_fitness"])
+
+    assert jnp.allclose(state.population, loop_state.population)
+    assert jnp.allclose(state.fitness, loop_state.fitness)
+    assert jnp.allclose(metrics["best_fitness"], jnp.stack(best_fitness))
+
+
+def test_simple_ga_shard(key, num_dims, population_size, bbob_problem):
+    """Sharding the population should not change the optimization trajectory."""
+    if len(jax.devices()) < 2:
+        pytest.skip("Sharding requires at least 2 devices")
+
+    num_generations = 4
+    solution = bbob_problem.sample(key)
+    algo = SimpleGA(population_size=population_size, solution=solution)
+    mesh = jax.make_mesh((len(jax.devices()),), ("pop",))
+    sharded_algo = algo.shard(mesh)
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    problem_state = bbob_problem.init(subkey)
+
+    key, subkey = jax.random.split(key)
+    population_init = jax.random.normal(subkey, (population_size, num_dims))
+    key, subkey = jax.random.split(key)
+    fitness_init, problem_state, _ = bbob_problem.eval(
+        subkey, population_init, problem_state
+    )
+
+    key, key_init, key_run = jax.random.split(key, 3)
+    state = algo.init(key_init, population_init, fitness_init, params)
+    _, _, metrics = algo.run_n_steps(
+        key_run, state, params, bbob_problem.eval, problem_state, num_generations
+    )
+
+    state = sharded_algo.init(key_init, population_init, fitness_init, params)
+    _, _, sharded_metrics = sharded_algo.run_n_steps(
+        key_run, state, params, bbob_problem.eval, problem_state, num_generations
+    )
+
+    assert algo.population_sharding is None
+    assert jnp.allclose(metrics["best_fitness"], sharded_metrics["best_fitness"])
+
+    # The sharding constraint is applied to the population returned by ask
+    population, _ = sharded_algo.ask(key_run, state, params)
+    assert isinstance(population.sharding, NamedSharding)
+    assert population.sharding.spec == PartitionSpec("pop")
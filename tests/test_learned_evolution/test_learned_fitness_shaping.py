@@ -0,0 +1,38 @@
+"""Tests for learned evolution fitness shaping functions."""
+
+import jax
+import jax.numpy as jnp
+from evosax.learned_evolution.fitness_shaping import (
+    centered_rank,
+    normalize,
+    rank,
+    standardize,
+)
+
+
+def test_centered_rank():
+    """Test centered ranks against rescaled integer ranks."""
+    for fitness in [
+        jax.random.normal(jax.random.key(0), (17,)),
+        jnp.array([3, 1, 2, 0]),
+    ]:
+        result = centered_rank(fitness)
+        expected = rank(fitness) / (fitness.size - 1) - 0.5
+        assert jnp.issubdtype(result.dtype, jnp.floating)
+        assert jnp.allclose(result, expected)
+
+    # Low precision fitness is ranked in at least float32
+    fitness = jnp.arange(64, dtype=jnp.bfloat16)
+    result = centered_rank(fitness)
+    assert result.dtype == jnp.float32
+    assert jnp.allclose(result, jnp.linspace(-0.5, 0.5, 64))
+
+
+def test_assume_finite():
+    """Test that plain reductions match NaN-aware ones on finite fitness."""
+    fitness = jax.random.normal(jax.random.key(0), (16,))
+    assert jnp.allclose(standardize(fitness, assume_finite=True), standardize(fitness))
+    assert jnp.allclose(
+        normalize(fitness, -0.5, 0.5, assume_finite=True),
+        normalize(fitness, -0.5, 0.5),
+    )
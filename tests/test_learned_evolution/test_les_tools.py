@@ -0,0 +1,130 @@
+"""Tests for learned evolution tools."""
+
+import jax
+import jax.numpy as jnp
+from evosax.learned_evolution.evotf_tools.features.fitness import get_norm_diff_best
+from evosax.learned_evolution.les_tools import (
+    AttentionWeights,
+    EvoPathMLP,
+    FitnessFeatures,
+    convert_legacy_les_params,
+    norm_diff_best,
+)
+from flax import linen as nn
+
+
+class LegacyAttentionWeights(nn.Module):
+    """AttentionWeights with separate key, query and value Dense layers."""
+
+    att_hidden_dims: int = 8
+
+    @nn.compact
+    def __call__(self, X: jax.Array) -> jax.Array:
+        keys = nn.Dense(self.att_hidden_dims)(X)
+        queries = nn.Dense(self.att_hidden_dims)(X)
+        values = nn.Dense(1)(X)
+        A = nn.softmax(jnp.matmul(queries, keys.T) / jnp.sqrt(X.shape[0]))
+        weights = nn.softmax(jnp.matmul(A, values).squeeze())
+        return weights[:, None]
+
+
+class LegacyEvoPathMLP(nn.Module):
+    """EvoPathMLP with separate mean and std learning rate heads."""
+
+    mlp_hidden_dims: int = 8
+
+    @nn.compact
+    def __call__(
+        self,
+        path_c: jax.Array,
+        path_sigma: jax.Array,
+        time_embed: jax.Array,
+    ):
+        timestamps = jnp.repeat(time_embed[None, ...], repeats=path_c.shape[0], axis=0)
+        X = jnp.concatenate([path_c, path_sigma, timestamps], axis=1)
+        hidden = nn.relu(nn.Dense(self.mlp_hidden_dims)(X))
+        lrs_mean = nn.sigmoid(nn.Dense(1)(hidden)).squeeze()
+        lrs_sigma = nn.sigmoid(nn.Dense(1)(hidden)).squeeze()
+        return lrs_mean, lrs_sigma
+
+
+def clipped_norm_diff_best(fitness, best_fitness):
+    """Reference implementation that clips fitness to [-1e10, 1e10] first."""
+    diff_best = jnp.clip(fitness, -1e10, 1e10) - best_fitness
+    return jnp.clip(
+        diff_best / (jnp.nanmax(diff_best) - jnp.nanmin(diff_best) + 1e-10), -1, 1
+    )
+
+
+def test_norm_diff_best():
+    """Test normalized difference to best fitness on finite inputs."""
+    fitness = jnp.array([1.0, 2.0, 3.0])
+    result = norm_diff_best(fitness, 0.5)
+    assert jnp.allclose(result, jnp.array([0.25, 0.75, 1.0]))
+
+    # Removing the wide-range clip must not change results for finite fitness
+    key = jax.random.key(0)
+    fitness = 1e3 * jax.random.normal(key, (32,))
+    for best_fitness in [-1e3, 0.0, 1e3]:
+        expected = clipped_norm_diff_best(fitness, best_fitness)
+        assert jnp.allclose(norm_diff_best(fitness, best_fitness), expected)
+        assert jnp.allclose(get_norm_diff_best(fitness, best_fitness), expected)
+
+
+def test_fitness_features_assume_finite():
+    """Test that assume_finite features match the NaN-aware default."""
+    key_x, key_fitness = jax.random.split(jax.random.key(0))
+    x = jax.random.normal(key_x, (16, 3))
+    fitness = jax.random.normal(key_fitness, (16,))
+    kwargs = dict(
+        centered_rank=True, z_score=True, diff_best=True, norm_range=True, w_decay=0.1
+    )
+
+    expected = FitnessFeatures(**kwargs).apply(x, fitness, 0.0)
+    result = FitnessFeatures(**kwargs, assume_finite=True).apply(x, fitness, 0.0)
+    assert result.shape == (16, 6)
+    assert jnp.allclose(result, expected)
+
+
+def test_convert_legacy_attention_weights():
+    """Test that converted legacy attention params match the fused module."""
+    key_init, key_x, key_lrate = jax.random.split(jax.random.key(0), 3)
+    X = jax.random.normal(key_x, (16, 5))
+    legacy_params = LegacyAttentionWeights().init(key_init, X)
+
+    path = jnp.zeros((4, 3))
+    lrate_params = EvoPathMLP().init(key_lrate, path, path, jnp.zeros(13))
+    les_params = {"recomb_weights": legacy_params, "lrate_modulation": lrate_params}
+
+    converted = convert_legacy_les_params(les_params)
+    expected = LegacyAttentionWeights().apply(legacy_params, X)
+    result = AttentionWeights().apply(converted["recomb_weights"], X)
+    assert jnp.allclose(result, expected, atol=1e-6)
+
+    # Already fused params pass through unchanged
+    fused = convert_legacy_les_params(converted)
+    assert jax.tree.all(
+        jax.tree.map(lambda a, b: jnp.array_equal(a, b), fused, converted)
+    )
+
+
+def test_convert_legacy_evo_path_mlp():
+    """Test that converted legacy learning rate heads match the fused module."""
+    key_init, key_recomb, key_c, key_sigma, key_t = jax.random.split(
+        jax.random.key(0), 5
+    )
+    path_c = jax.random.normal(key_c, (16, 3))
+    path_sigma = jax.random.normal(key_sigma, (16, 3))
+    time_embed = jax.random.normal(key_t, (13,))
+    legacy_params = LegacyEvoPathMLP().init(key_init, path_c, path_sigma, time_embed)
+
+    recomb_params = AttentionWeights().init(key_recomb, jnp.zeros((4, 5)))
+    les_params = {"recomb_weights": recomb_params, "lrate_modulation": legacy_params}
+
+    converted = convert_legacy_les_params(les_params)
+    expected = LegacyEvoPathMLP().apply(legacy_params, path_c, path_sigma, time_embed)
+    result = EvoPathMLP().apply(
+        converted["lrate_modulation"], path_c, path_sigma, time_embed
+    )
+    for r, e in zip(result, expected):
+        assert jnp.allclose(r, e, atol=1e-6)